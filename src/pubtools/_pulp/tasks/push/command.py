@@ -1,8 +1,8 @@
 import logging
 import sys
 
+from contextlib import ExitStack
 
-from .contextlib_compat import exitstack
 from .phase import (
     LoadPushItems,
     LoadChecksums,
@@ -162,7 +162,10 @@ class Push(
         # start them all.
         #
         # This will start all the phases...
-        with exitstack([ProgressLogger.for_context(ctx)] + phases):
+        with ExitStack() as stack:
+            for cm in [ProgressLogger.for_context(ctx)] + phases:
+                stack.enter_context(cm)
+
             LOG.debug("All push phases are now running.")
             # ...and exiting the 'with' block here will wait for them to
             # complete.
@@ -381,7 +381,12 @@ class PulpPushItem(object):
 
     def with_checksums(self):
         """Return a copy of this item with checksums guaranteed to be present."""
-        return attr.evolve(self, pushsource_item=self.pushsource_item.with_checksums())
+        pushsource_item = self.pushsource_item
+        if pushsource_item.md5sum and pushsource_item.sha256sum:
+            # Checksums are already known, nothing to calculate.
+            return self
+
+        return attr.evolve(self, pushsource_item=pushsource_item.with_checksums())
 
     @property
     def blocking_checksums(self):
@@ -432,12 +437,11 @@ class PulpPushItem(object):
 
         # If the unit is present, but the state doesn't match what we want, mark it
         # as needing an update.
-        if (
-            state in [State.PARTIAL, State.IN_REPOS]
-            and out.unit_for_update
-            and out.unit_for_update != unit
-        ):
-            out = attr.evolve(out, pulp_state=State.NEEDS_UPDATE)
+        if state in [State.PARTIAL, State.IN_REPOS]:
+            # unit_for_update may build a new unit each time, so only ask once.
+            unit_for_update = out.unit_for_update
+            if unit_for_update and unit_for_update != unit:
+                out = attr.evolve(out, pulp_state=State.NEEDS_UPDATE)
 
         return out
 
@@ -85,19 +85,18 @@ class PulpErratumPushItem(PulpPushItem):
         #
         out = set(super(PulpErratumPushItem, self).publish_pulp_repos)
 
-        for repo_id in self.in_pulp_repos:
-            # Though the existing code doesn't push errata to all-rpm-content,
-            # historically advisories have been pushed there. We shouldn't return
-            # this from publish_pulp_repos as there's no point in trying to publish
-            # it, and worse, UD cache flush on this repo gives a fatal error.
-            #
-            # Also note that there's an entire family of these repos, hence the
-            # startswith rather than plain equality check.
-            if not (
-                repo_id.startswith("all-rpm-content")
-                or repo_id.startswith("all-erratum-content")
-            ):
-                out.add(repo_id)
+        # Though the existing code doesn't push errata to all-rpm-content,
+        # historically advisories have been pushed there. We shouldn't return
+        # this from publish_pulp_repos as there's no point in trying to publish
+        # it, and worse, UD cache flush on this repo gives a fatal error.
+        #
+        # Also note that there's an entire family of these repos, hence the
+        # startswith rather than plain equality check.
+        out.update(
+            repo_id
+            for repo_id in self.in_pulp_repos
+            if not repo_id.startswith(("all-rpm-content", "all-erratum-content"))
+        )
 
         return sorted(out)
 
@@ -213,7 +213,10 @@ class Phase(object):
 
             while not batch_ready():
                 try:
-                    extend_batch(timeout)
+                    # Only wait for whatever is left of the batch timeout, so a
+                    # slow trickle of input can't hold a batch back for up to
+                    # another full timeout.
+                    extend_batch(max(timeout - (monotonic() - start_time), 0))
                 except Empty:
                     # batch_ready() will now be true
                     pass
@@ -363,13 +366,12 @@ class Phase(object):
             # as those will have already been caught.
             # However we can get here if for example someone hits CTRL+C to generate
             # a KeyboardInterrupt.
-            if not self.context.has_error:
-                LOG.debug(
-                    "%s: marking context failed due to exception",
-                    self.name,
-                    exc_info=exc_val,
-                )
-                self.context.set_error(self.name, exc_val)
+            LOG.debug(
+                "%s: marking context failed due to exception",
+                self.name,
+                exc_info=exc_val,
+            )
+            self.context.set_error(self.name, exc_val)
 
         LOG.debug("%s: joining", self.name)
         self.__thread.join(timeout=constants.PHASE_TIMEOUT)
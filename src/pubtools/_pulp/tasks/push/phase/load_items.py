@@ -68,7 +68,12 @@ class LoadPushItems(Phase):
             # filter out the rest.
             dest = [val for val in item.dest if "/" not in val]
 
-            pulp_item = PulpPushItem.for_item(attr.evolve(item, dest=dest))
+            # Most items have nothing to filter, so only copy them if needed.
+            filtered_item = item
+            if len(dest) != len(item.dest):
+                filtered_item = attr.evolve(item, dest=dest)
+
+            pulp_item = PulpPushItem.for_item(filtered_item)
 
             if not pulp_item:
                 LOG.info("Skipping unsupported type: %s", item)
@@ -61,6 +61,10 @@ class ProgressLogger(object):
         event logged via 'extra'.
         """
 
+        if not LOG.isEnabledFor(logging.INFO):
+            # Nothing would be logged, so don't bother building the report.
+            return
+
         if width is None:
             width = int(os.environ.get("COLUMNS") or "80")
 
@@ -129,8 +133,7 @@ class ProgressLogger(object):
 
             # Seeing as we've truncated downwards to get integers, we may
             # need to pad a few more spaces to fill out the bar
-            while len(bar1 + bar2 + bar3) < bar_width:
-                bar3 = bar3 + " "
+            bar3 += " " * (bar_width - len(bar1) - len(bar2) - len(bar3))
 
             bar_str = template_str % (pi.name, bar1, bar2, bar3)
 
@@ -0,0 +1,161 @@
+from datetime import datetime
+from operator import attrgetter
+
+import pytest
+from more_executors.futures import f_return
+
+from pubtools.pulplib import FakeController, Client, Distributor, Repository
+
+from pubtools._pulp.ud import UdCacheClient
+from pubtools._pulp.tasks.publish import Publish
+
+# Flushes are instant in the fake, so every request can share one
+# already-resolved future.
+FLUSHED = f_return()
+
+
+class FakeUdCache(object):
+    __slots__ = ("flushed_repos", "flushed_products")
+
+    def __init__(self):
+        self.flushed_repos = []
+        self.flushed_products = []
+
+    def flush_repo(self, repo_id):
+        self.flushed_repos.append(repo_id)
+        return FLUSHED
+
+    def flush_product(self, product_id):
+        self.flushed_products.append(product_id)
+        return FLUSHED
+
+
+class FakePublish(Publish):
+    """publish with services overridden for test"""
+
+    def __init__(self, *args, **kwargs):
+        super(FakePublish, self).__init__(*args, **kwargs)
+        self.pulp_client_controller = FakeController()
+        self._udcache_client = FakeUdCache()
+        self._udcache_enabled = None
+        self._pulp_client_checked = False
+
+    @property
+    def pulp_client(self):
+        if not self._pulp_client_checked:
+            # Super should give a Pulp client
+            assert isinstance(super(FakePublish, self).pulp_client, Client)
+            self._pulp_client_checked = True
+        # But we'll substitute our own
+        return self.pulp_client_controller.client
+
+    @property
+    def udcache_client(self):
+        if self._udcache_enabled is None:
+            # Super may or may not give a UD client, depends on arguments.
+            # That can't change once arguments are parsed, so only ask once.
+            from_super = super(FakePublish, self).udcache_client
+            if from_super:
+                # If it did create one, it should be this
+                assert isinstance(from_super, UdCacheClient)
+            self._udcache_enabled = bool(from_super)
+
+        # We'll substitute our own, only if UD client is being used
+        return self._udcache_client if self._udcache_enabled else None
+
+    # override to generate consistent repo sequence in the logs
+    def publish_with_cache_flush(self, repos, *args, **kwargs):
+        return super(FakePublish, self).publish_with_cache_flush(
+            sorted(repos, key=attrgetter("id")), *args, **kwargs
+        )
+
+
+def add_repos(controller):
+    # test repos added to the controller
+    dt1 = datetime(2019, 9, 10, 0, 0, 0)
+    r1_d1 = Distributor(
+        id="yum_distributor",
+        type_id="yum_distributor",
+        repo_id="repo1",
+        last_publish=dt1,
+        relative_url="content/unit/1/client",
+    )
+    r1_d2 = Distributor(
+        id="cdn_distributor",
+        type_id="rpm_rsync_distributor",
+        repo_id="repo1",
+        last_publish=dt1,
+        relative_url="content/unit/1/client",
+    )
+    repo1 = Repository(
+        id="repo1",
+        eng_product_id=101,
+        distributors=[r1_d1, r1_d2],
+        relative_url="content/unit/1/client",
+        mutable_urls=["mutable1", "mutable2"],
+    )
+
+    dt2 = datetime(2019, 9, 12, 0, 0, 0)
+    d2 = Distributor(
+        id="yum_distributor",
+        type_id="yum_distributor",
+        repo_id="repo2",
+        last_publish=dt2,
+        relative_url="content/unit/2/client",
+    )
+    repo2 = Repository(
+        id="repo2",
+        eng_product_id=102,
+        distributors=[d2],
+        relative_url="content/unit/2/client",
+    )
+
+    dt3 = datetime(2019, 9, 7, 0, 0, 0)
+    d3 = Distributor(
+        id="cdn_distributor",
+        type_id="rpm_rsync_distributor",
+        repo_id="repo3",
+        last_publish=dt3,
+        relative_url="content/unit/3/client",
+    )
+    repo3 = Repository(
+        id="repo3",
+        eng_product_id=103,
+        distributors=[d3],
+        relative_url="content/unit/3/client",
+    )
+
+    dt4 = datetime(2019, 9, 9, 0, 0, 0)
+    d4 = Distributor(
+        id="cdn_distributor",
+        type_id="rpm_rsync_distributor",
+        repo_id="repo4",
+        last_publish=dt4,
+        relative_url="content/unit/4/client",
+    )
+    repo4 = Repository(
+        id="repo4",
+        # omit eng ID -- UD can't flush this repo
+        distributors=[d4],
+        relative_url="content/unit/4/client",
+        mutable_urls=["mutable1", "mutable2"],
+    )
+
+    controller.insert_repository(repo1)
+    controller.insert_repository(repo2)
+    controller.insert_repository(repo3)
+    controller.insert_repository(repo4)
+
+
+@pytest.fixture
+def fake_publish():
+    """A FakePublish instance backed by an empty fake Pulp."""
+    return FakePublish()
+
+
+@pytest.fixture
+def fake_pulp(fake_publish):
+    """The fake Pulp controller used by fake_publish, populated with test repos."""
+    controller = fake_publish.pulp_client_controller
+    add_repos(controller)
+    return controller
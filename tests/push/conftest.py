@@ -82,9 +82,9 @@ class StubCollector(object):
 
 
 @pytest.fixture
-def fake_state_path(tmpdir):
+def fake_state_path(tmp_path):
     """Yields path to a temporary state file used by PersistentFake during each test."""
-    return str(tmpdir.join("fake-pulp-state.yaml"))
+    return str(tmp_path / "fake-pulp-state.yaml")
 
 
 @pytest.fixture
@@ -91,12 +91,12 @@ def test_association_race(
 
     # We can determine that publish didn't occur by checking all
     # encountered states of push items.
-    all_states = set([item["state"] for item in stub_collector])
+    all_states = {item["state"] for item in stub_collector}
 
     # Everything should be either PENDING (before upload to Pulp)
     # or EXISTS (after upload), but nothing should be PUSHED since
     # publish didn't happen.
-    assert all_states == set(["PENDING", "EXISTS"])
+    assert all_states == {"PENDING", "EXISTS"}
 
     # Assert there was exactly one retry of association.
     msg = "Retrying copy for 1 item(s). Attempt 1/5"
@@ -10,6 +10,14 @@ from pubtools._pulp.tasks.push.items import (
 from pubtools._pulp.tasks.push.phase import Context, Collect, Phase, constants
 
 
+def with_state(item, state):
+    """Returns a copy of a PulpPushItem with the underlying push item's state
+    set to the given value."""
+    return attr.evolve(
+        item, pushsource_item=attr.evolve(item.pushsource_item, state=state)
+    )
+
+
 def test_collect_dupes():
     """Collect phase filters out duplicate items during iteration."""
 
@@ -31,24 +39,9 @@ def test_collect_dupes():
 
     # Let's add some duplicates of what's already there, just with an
     # updated state.
-    files.append(
-        attr.evolve(
-            files[0],
-            pushsource_item=attr.evolve(files[0].pushsource_item, state="EXISTS"),
-        )
-    )
-    files.append(
-        attr.evolve(
-            files[0],
-            pushsource_item=attr.evolve(files[0].pushsource_item, state="PUSHED"),
-        )
-    )
-    files.append(
-        attr.evolve(
-            files[4],
-            pushsource_item=attr.evolve(files[4].pushsource_item, state="WHATEVER"),
-        )
-    )
+    files.append(with_state(files[0], "EXISTS"))
+    files.append(with_state(files[0], "PUSHED"))
+    files.append(with_state(files[4], "WHATEVER"))
 
     # Sanity check: now we have this many files
     assert len(files) == 13
@@ -4,10 +4,10 @@ import logging
 import textwrap
 import threading
 
+from contextlib import ExitStack
 from threading import Semaphore
 
 from pubtools._pulp.tasks.push.phase import Context, Phase, ProgressLogger, constants
-from pubtools._pulp.tasks.push.contextlib_compat import exitstack
 
 
 class SynchronizedPhase(Phase):
@@ -82,7 +82,10 @@ def test_context_counts(caplog):
     assert [pi.name for pi in progress_infos] == ["phase 1", "phase 2", "phase 3"]
 
     # Now allow all the phases to start.
-    with exitstack([p1, p2, p3]):
+    with ExitStack() as stack:
+        for phase in [p1, p2, p3]:
+            stack.enter_context(phase)
+
         # Put a few batches onto the first queue, 35 items in total.
         q1.put(list(range(0, 10)))
         q1.put(list(range(10, 20)))
@@ -182,6 +185,24 @@ def test_context_counts(caplog):
                 in_sem3.release()
 
 
+def test_dump_progress_log_disabled(caplog):
+    """dump_progress logs nothing if INFO level is not enabled."""
+
+    progress_logger = ProgressLogger(Context())
+
+    caplog.set_level(logging.WARNING, logger="pubtools.pulp")
+    progress_logger.dump_progress(width=70)
+
+    # Nothing should have been logged.
+    assert not [msg for msg in caplog.messages if "Progress:" in msg]
+
+    # Sanity check: the same call does log once INFO is enabled.
+    caplog.set_level(logging.INFO, logger="pubtools.pulp")
+    progress_logger.dump_progress(width=70)
+
+    assert "Progress:" in caplog.messages[-1]
+
+
 def test_context_progress_logger_disabled():
     """An interval of 0 disables the progress logger."""
 
@@ -217,7 +238,10 @@ def test_progress_no_out_queue():
         in_sem2, out_sem2, 5, context=ctx, in_queue=q2, out_queue=None, name="phase 2"
     )
 
-    with exitstack([p1, p2]):
+    with ExitStack() as stack:
+        for phase in [p1, p2]:
+            stack.enter_context(phase)
+
         # Put a few batches onto the first queue, 35 items in total.
         q1.put(list(range(0, 10)))
         q1.put(constants.FINISHED)
@@ -262,7 +286,10 @@ def test_progress_no_out_queue_explicit_incr():
         in_sem2, out_sem2, 5, context=ctx, in_queue=q2, out_queue=None, name="phase 2"
     )
 
-    with exitstack([p1, p2]):
+    with ExitStack() as stack:
+        for phase in [p1, p2]:
+            stack.enter_context(phase)
+
         # Put a few batches onto the first queue, 35 items in total.
         q1.put(list(range(0, 10)))
         q1.put(constants.FINISHED)
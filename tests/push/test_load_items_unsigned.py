@@ -0,0 +1,62 @@
+from pushsource import Source, RpmPushItem
+
+from pubtools._pulp.tasks.push.phase import Context, LoadPushItems, constants
+
+
+def test_load_unsigned_fails():
+    """Loading an unsigned RPM fails if unsigned content is not allowed."""
+
+    ctx = Context()
+    phase = LoadPushItems(
+        ctx,
+        ["fake:"],
+        allow_unsigned=False,
+        pre_push=False,
+    )
+
+    fake_items = [RpmPushItem(name="quux", src="/some/unsigned.rpm", dest=["repo1"])]
+    Source.register_backend("fake", lambda: fake_items)
+
+    # Let it run to completion...
+    with phase:
+        pass
+
+    # It should have failed, and told us why.
+    assert ctx.has_error
+    assert ctx.error_phase == phase.name
+    assert "Unsigned content is not permitted: /some/unsigned.rpm" in str(
+        ctx.error_exception
+    )
+
+
+def test_load_unsigned_allowed():
+    """Loading an unsigned RPM succeeds if unsigned content is allowed."""
+
+    ctx = Context()
+    phase = LoadPushItems(
+        ctx,
+        ["fake:"],
+        allow_unsigned=True,
+        pre_push=False,
+    )
+
+    fake_items = [RpmPushItem(name="quux", src="/some/unsigned.rpm", dest=["repo1"])]
+    Source.register_backend("fake", lambda: fake_items)
+
+    # Let it run to completion...
+    with phase:
+        pass
+
+    # It should have succeeded
+    assert not ctx.has_error
+
+    # Now let's get everything from the output queue.
+    all_outputs = []
+    while True:
+        items = phase.out_queue.get()
+        if items is constants.FINISHED:
+            break
+        all_outputs.extend([item.pushsource_item for item in items])
+
+    # The unsigned item should have come through as is.
+    assert all_outputs == fake_items
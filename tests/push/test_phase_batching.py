@@ -1,5 +1,5 @@
 import time
-from threading import Thread
+from threading import Event, Thread
 
 import pytest
 
@@ -96,3 +96,57 @@ def test_iter_respects_timeout(monkeypatch):
 
     finally:
         stop_write_items()
+
+
+def test_iter_trickle_respects_timeout(monkeypatch):
+    """iter_input_batched doesn't let a slow trickle of input hold a batch back
+    past the requested timeout."""
+
+    monkeypatch.setattr(constants, "QUEUE_SIZE", 100)
+    monkeypatch.setattr(constants, "BATCH_TIMEOUT", 1.0)
+    monkeypatch.setattr(constants, "BATCH_MAX_TIMEOUT", 1.0)
+
+    ctx = Context()
+
+    # Make this smaller than usual for a more responsive test.
+    ctx.interrupt_interval = 0.1
+
+    queue = ctx.new_queue()
+    phase = Phase(ctx, in_queue=queue)
+
+    # Start a thread which puts one item straight away and another one shortly
+    # before the batch timeout expires, then nothing until asked to stop.
+    stop_thread = Event()
+
+    def write_items():
+        queue.put([0])
+        time.sleep(0.6)
+        queue.put([1])
+        stop_thread.wait(10.0)
+        queue.put(constants.FINISHED)
+
+    thread = Thread(target=write_items)
+    thread.start()
+
+    def stop_write_items():
+        stop_thread.set()
+        thread.join()
+
+    try:
+        start = time.monotonic()
+        got_batches = []
+        for batch in phase.iter_input_batched():
+            if not got_batches:
+                elapsed = time.monotonic() - start
+            got_batches.append(batch)
+            stop_write_items()
+
+        # Both items should have arrived in the first batch...
+        assert got_batches == [[0, 1]]
+
+        # ...and the late item should not have extended the wait by another
+        # full timeout (which would put us at around 1.6 seconds).
+        assert elapsed < 1.4
+
+    finally:
+        stop_write_items()
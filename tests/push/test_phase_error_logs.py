@@ -32,7 +32,7 @@ class AsyncErrorPhase(Phase):
 def test_immediate_raise(caplog):
     """Immediate raise in phase's run() will be logged as a fatal error."""
 
-    caplog.set_level(logging.INFO)
+    caplog.set_level(logging.WARNING)
 
     ctx = Context()
 
@@ -53,7 +53,7 @@ def test_immediate_raise(caplog):
 def test_async_raise(caplog):
     """Async raise via put_future_output will be logged as a fatal error."""
 
-    caplog.set_level(logging.INFO)
+    caplog.set_level(logging.WARNING)
 
     ctx = Context()
 
@@ -74,7 +74,7 @@ def test_async_raise(caplog):
 def test_raise_in_with_block(caplog):
     """Immediate raise within phase's with block will set context failed."""
 
-    caplog.set_level(logging.INFO)
+    caplog.set_level(logging.WARNING)
 
     ctx = Context()
 
@@ -13,60 +13,22 @@ def test_updates_product_versions(tmpdir):
     ctrl = FakeController()
 
     # Set up a family of repos with various product_versions.
-    repo1 = YumRepository(id="repo1")
-    repo2 = YumRepository(
-        id="repo2",
-        arch="x86_64",
-        eng_product_id=1234,
-        platform_full_version="xyz",
-        product_versions=["a", "b"],
-    )
-    repo3 = YumRepository(
-        id="repo3",
-        arch="x86_64",
-        eng_product_id=1234,
-        platform_full_version="xyz",
-        product_versions=["b", "c"],
-    )
-    repo4 = YumRepository(
-        id="repo4",
-        arch="x86_64",
-        eng_product_id=1234,
-        platform_full_version="xyz",
-        product_versions=None,
-    )
-    repo5 = YumRepository(
-        id="repo5",
-        arch="x86_64",
-        eng_product_id=1234,
-        platform_full_version="xyz",
-        product_versions=["c", "d"],
-    )
-    repo6 = YumRepository(
-        id="repo6",
-        arch="x86_64",
-        eng_product_id=1234,
-        product_versions=["d", "e"],
-    )
-    repo7 = YumRepository(
-        id="repo7",
-        arch="s390x",
-        product_versions=["b"],
-    )
-    repo8 = YumRepository(
-        id="repo8",
-        arch="s390x",
-        product_versions=[],
-    )
-
-    ctrl.insert_repository(repo1)
-    ctrl.insert_repository(repo2)
-    ctrl.insert_repository(repo3)
-    ctrl.insert_repository(repo4)
-    ctrl.insert_repository(repo5)
-    ctrl.insert_repository(repo6)
-    ctrl.insert_repository(repo7)
-    ctrl.insert_repository(repo8)
+    # Most of them are related through the same product & platform.
+    related = dict(arch="x86_64", eng_product_id=1234, platform_full_version="xyz")
+    repos = [
+        YumRepository(id="repo1"),
+        YumRepository(id="repo2", product_versions=["a", "b"], **related),
+        YumRepository(id="repo3", product_versions=["b", "c"], **related),
+        YumRepository(id="repo4", product_versions=None, **related),
+        YumRepository(id="repo5", product_versions=["c", "d"], **related),
+        YumRepository(
+            id="repo6", arch="x86_64", eng_product_id=1234, product_versions=["d", "e"]
+        ),
+        YumRepository(id="repo7", arch="s390x", product_versions=["b"]),
+        YumRepository(id="repo8", arch="s390x", product_versions=[]),
+    ]
+    for repo in repos:
+        ctrl.insert_repository(repo)
 
     # make a fake productid file.
     # content doesn't matter since we inject the ProductIDs, it just has
@@ -1,4 +1,5 @@
 import os
+from collections import defaultdict
 from functools import partial
 
 import attr
@@ -102,13 +103,10 @@ def test_uploads_shared(data_path):
     ]
 
     # Look at the pulp units created.
-    outputs = {}
-    while True:
-        items = phase.out_queue.get()
-        if items is constants.FINISHED:
-            break
+    outputs = defaultdict(list)
+    for items in iter(phase.out_queue.get, constants.FINISHED):
         for item in items:
-            outputs.setdefault(item.pushsource_item.name, []).append(item.pulp_unit)
+            outputs[item.pushsource_item.name].append(item.pulp_unit)
 
     # Although there were two items dealing with this RPM...
     assert len(outputs["walrus-5.21-1.noarch.rpm"]) == 2
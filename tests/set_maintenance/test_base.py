@@ -1,3 +1,5 @@
+import sys
+
 import pytest
 from mock import patch
 
@@ -12,7 +14,7 @@ from pubtools.pulplib import (
 from pubtools._pulp.tasks.set_maintenance.base import SetMaintenance
 
 
-def test_no_implemented(command_tester):
+def test_no_implemented(command_tester, monkeypatch):
     task_instance = SetMaintenance()
 
     controller = FakeController()
@@ -21,7 +23,8 @@ def test_no_implemented(command_tester):
 
     arg = ["test-maintenance", "--pulp-url", "http://some.url", "--repo-ids", "repo1"]
 
+    monkeypatch.setattr(sys, "argv", arg)
+
     with patch("pubtools._pulp.services.PulpClientService.pulp_client", client):
         with pytest.raises(NotImplementedError):
-            with patch("sys.argv", arg):
-                task_instance.main()
+            task_instance.main()
@@ -19,12 +19,12 @@ def test_task_run():
         task.run()
 
 
-def test_init_args():
+def test_init_args(monkeypatch):
     """Checks whether the args from cli are available for the task"""
     task = TaskWithPulpClient()
     arg = ["", "--pulp-url", "http://some.url", "--debug"]
-    with patch("sys.argv", arg):
-        task_args = task.args
+    monkeypatch.setattr(sys, "argv", arg)
+    task_args = task.args
 
     cli_args = [
         "pulp_url",
@@ -38,12 +38,12 @@ def test_init_args():
         assert hasattr(task_args, a)
 
 
-def test_pulp_client():
+def test_pulp_client(monkeypatch):
     """Checks that the client in the task is an instance of pubtools.pulplib.Client"""
     with TaskWithPulpClient() as task:
         arg = ["", "--pulp-url", "http://some.url", "--pulp-user", "user"]
-        with patch("sys.argv", arg):
-            client = task.pulp_client
+        monkeypatch.setattr(sys, "argv", arg)
+        client = task.pulp_client
 
     assert isinstance(client, Client)
 
@@ -57,7 +57,9 @@ def test_pulp_client():
     ids=("args_crt_and_key", "args_cert_pem"),
 )
 @patch("pubtools.pluggy.pm.hook.get_cert_key_paths")
-def test_pub_client_args_cert(mock_hook, args_cert, args_key, expected_kwargs):
+def test_pub_client_args_cert(
+    mock_hook, monkeypatch, args_cert, args_key, expected_kwargs
+):
     """
     Assuming certs are not passed in any way.
     Checks if certificate is used when passed as argument.
@@ -84,14 +86,14 @@ def test_pub_client_args_cert(mock_hook, args_cert, args_key, expected_kwargs):
                     str(args_key),
                 ]
             )
-        with patch("sys.argv", arg):
-            with patch("pubtools._pulp.services.pulp.pulplib.Client") as mock_client:
-                with patch("pubtools._pulp.task.PulpTask.run"):
-                    assert task.main() == 0
-                    assert task.pulp_client
+        monkeypatch.setattr(sys, "argv", arg)
+        with patch("pubtools._pulp.services.pulp.pulplib.Client") as mock_client:
+            with patch("pubtools._pulp.task.PulpTask.run"):
+                assert task.main() == 0
+                assert task.pulp_client
 
-                    client_kwargs = mock_client.mock_calls[0].kwargs
-                    assert client_kwargs["cert"] == expected_kwargs
+                client_kwargs = mock_client.mock_calls[0].kwargs
+                assert client_kwargs["cert"] == expected_kwargs
 
 
 @pytest.mark.parametrize(
@@ -100,7 +102,7 @@ def test_pub_client_args_cert(mock_hook, args_cert, args_key, expected_kwargs):
     ids=("hook_cert_crt_and_key", "hook_cert_pem"),
 )
 @patch("pubtools.pluggy.pm.hook.get_cert_key_paths")
-def test_pub_client_hook_cert(mock_hook, tmp_path, hook_cert, hook_key):
+def test_pub_client_hook_cert(mock_hook, monkeypatch, tmp_path, hook_cert, hook_key):
     """
     Checks if cert is returned when the hook is used.
     Assuming password is not passed as argument.
@@ -118,23 +120,23 @@ def test_pub_client_hook_cert(mock_hook, tmp_path, hook_cert, hook_key):
             "--pulp-url",
             "http://some.url",
         ]
-        with patch("sys.argv", arg):
-            with patch("pubtools._pulp.services.pulp.pulplib.Client") as mock_client:
-                with patch("pubtools._pulp.task.PulpTask.run"):
-                    assert task.main() == 0
-                    assert task.pulp_client
-
-                    client_kwargs = mock_client.mock_calls[0].kwargs
-                    # verify if kwargs contains the certificate file(s)
-                    # with a key file present, we should get a (crt, key) tuple
-                    if hook_key:
-                        assert client_kwargs["cert"] == (
-                            str(fake_hook_crt_pem),
-                            str(fake_hook_key),
-                        )
-                    # without a key file present, we should only get the crt/pem file
-                    else:
-                        assert client_kwargs["cert"] == str(fake_hook_crt_pem)
+        monkeypatch.setattr(sys, "argv", arg)
+        with patch("pubtools._pulp.services.pulp.pulplib.Client") as mock_client:
+            with patch("pubtools._pulp.task.PulpTask.run"):
+                assert task.main() == 0
+                assert task.pulp_client
+
+                client_kwargs = mock_client.mock_calls[0].kwargs
+                # verify if kwargs contains the certificate file(s)
+                # with a key file present, we should get a (crt, key) tuple
+                if hook_key:
+                    assert client_kwargs["cert"] == (
+                        str(fake_hook_crt_pem),
+                        str(fake_hook_key),
+                    )
+                # without a key file present, we should only get the crt/pem file
+                else:
+                    assert client_kwargs["cert"] == str(fake_hook_crt_pem)
 
 
 def test_pulp_fake_client(monkeypatch, tmpdir):
@@ -146,9 +148,9 @@ def test_pulp_fake_client(monkeypatch, tmpdir):
 
     with TaskWithPulpClient() as task:
         arg = ["", "--pulp-fake"]
-        with patch("sys.argv", arg):
-            with task_context():
-                client = task.pulp_client
+        monkeypatch.setattr(sys, "argv", arg)
+        with task_context():
+            client = task.pulp_client
 
         # Fake client doesn't advertise itself in any obvious way.
         # Just do some rough checks...
@@ -163,29 +165,29 @@ def test_pulp_fake_client(monkeypatch, tmpdir):
         assert list(client.search_repository().result())
 
 
-def test_pulp_missing_args(caplog):
+def test_pulp_missing_args(monkeypatch, caplog):
     """An error occurs if task is invoked with neither --pulp-url nor --pulp-fake."""
 
     with TaskWithPulpClient() as task:
         arg = [""]
-        with patch("sys.argv", arg):
-            with patch("pubtools._pulp.task.PulpTask.run"):
-                with pytest.raises(SystemExit) as excinfo:
-                    task.pulp_client
+        monkeypatch.setattr(sys, "argv", arg)
+        with patch("pubtools._pulp.task.PulpTask.run"):
+            with pytest.raises(SystemExit) as excinfo:
+                task.pulp_client
 
     assert excinfo.value.code == 41
     assert "At least one of --pulp-url or --pulp-fake must be provided" in caplog.text
 
 
-def test_main():
+def test_main(monkeypatch):
     """Checks main returns without exception when invoked with minimal args
     assuming run() and add_args() are implemented
     """
     with TaskWithPulpClient() as task:
         arg = ["", "--pulp-url", "http://some.url", "-d"]
-        with patch("sys.argv", arg):
-            with patch("pubtools._pulp.task.PulpTask.run"):
-                assert task.main() == 0
+        monkeypatch.setattr(sys, "argv", arg)
+        with patch("pubtools._pulp.task.PulpTask.run"):
+            assert task.main() == 0
 
 
 def test_description():
@@ -266,18 +268,18 @@ def test_pulp_throttle_invalid(monkeypatch, throttle, exception):
         ]
         if throttle:
             arg.extend(["--pulp-throttle", "xyz"])
-        with patch("sys.argv", arg):
-            with patch("pubtools._pulp.task.PulpTask.run"):
-                with pytest.raises(exception):
-                    task.main()
-                    assert task.pulp_client is None
+        monkeypatch.setattr(sys, "argv", arg)
+        with patch("pubtools._pulp.task.PulpTask.run"):
+            with pytest.raises(exception):
+                task.main()
+                assert task.pulp_client is None
 
 
-def test_pulp_throttle_negative():
+def test_pulp_throttle_negative(monkeypatch):
     """Checks main raises SystemExit when a negative int is passed with --pulp-throttle."""
     with TaskWithPulpClient() as task:
         arg = ["", "--pulp-url", "http://some.url", "-d", "--pulp-throttle", "-1"]
-        with patch("sys.argv", arg):
-            with patch("pubtools._pulp.task.PulpTask.run"):
-                with pytest.raises(SystemExit):
-                    task.main()
+        monkeypatch.setattr(sys, "argv", arg)
+        with patch("pubtools._pulp.task.PulpTask.run"):
+            with pytest.raises(SystemExit):
+                task.main()